@@ -1,5 +1,7 @@
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from openshift.dynamic.exceptions import ConflictError
 
@@ -8,7 +10,7 @@ from ocp_resources.node_network_configuration_enactment import (
 )
 from ocp_resources.node_network_state import NodeNetworkState
 from ocp_resources.resource import Resource
-from ocp_resources.utils import TimeoutExpiredError, TimeoutSampler
+from ocp_resources.utils import TimeoutExpiredError
 
 
 LOGGER = logging.getLogger(__name__)
@@ -48,8 +50,13 @@ class NodeNetworkConfigurationPolicy(Resource):
         node_active_nics=None,
         dns_resolver=None,
         routes=None,
+        worker_pods_by_node=None,
     ):
         """
+        worker_pods_by_node may be sent instead of worker_pods as a dict of
+        {<node-name>: <worker-pod>}, so the pod matching node_selector is found
+        without querying each pod.
+
         ipv4_addresses should be sent in this format:
         [{"ip": <ip1-string>, "prefix-length": <prefix-len1-int>},
          {"ip": <ip2-string>, "prefix-length": <prefix-len2-int>}, ...]
@@ -60,7 +67,8 @@ class NodeNetworkConfigurationPolicy(Resource):
         """
         super().__init__(name=name, client=client, teardown=teardown)
         self.desired_state = {"interfaces": []}
-        self.worker_pods = worker_pods
+        self._interfaces_by_name = {}
+        self.worker_pods = worker_pods or list((worker_pods_by_node or {}).values())
         self.mtu = mtu
         self.mtu_dict = {}
         self.ports = ports or []
@@ -72,6 +80,7 @@ class NodeNetworkConfigurationPolicy(Resource):
         self.ipv4_addresses = ipv4_addresses or []
         self.ipv6_enable = ipv6_enable
         self.ipv4_iface_state = {}
+        self._nns_cache = {}
         self.node_selector = node_selector
         self.dns_resolver = dns_resolver
         self.routes = routes
@@ -79,7 +88,9 @@ class NodeNetworkConfigurationPolicy(Resource):
             self._node_selector = {
                 f"{self.ApiGroup.KUBERNETES_IO}/hostname": self.node_selector
             }
-            if self.worker_pods:
+            if worker_pods_by_node and node_selector in worker_pods_by_node:
+                self.worker_pods = [worker_pods_by_node[node_selector]]
+            elif self.worker_pods:
                 for pod in self.worker_pods:
                     if pod.node.name == node_selector:
                         self.worker_pods = [pod]
@@ -90,15 +101,12 @@ class NodeNetworkConfigurationPolicy(Resource):
             }
 
     def set_interface(self, interface):
-        # First drop the interface if it's already in the list
-        interfaces = [
-            iface
-            for iface in self.desired_state["interfaces"]
-            if not (iface["name"] == interface["name"])
-        ]
-        # Add the interface
-        interfaces.append(interface)
-        self.desired_state["interfaces"] = interfaces
+        # Re-insert so an updated interface moves to the end, as a new one would
+        self._interfaces_by_name.pop(interface["name"], None)
+        self._interfaces_by_name[interface["name"]] = interface
+
+    def _refresh_desired_state(self):
+        self.desired_state["interfaces"] = list(self._interfaces_by_name.values())
 
     def to_dict(self):
         res = super().to_dict()
@@ -128,40 +136,36 @@ class NodeNetworkConfigurationPolicy(Resource):
             self.iface["ipv6"] = {"enabled": self.ipv6_enable}
 
             self.set_interface(interface=self.iface)
-            if self.iface["name"] not in [_iface["name"] for _iface in self.ifaces]:
+            if not any(_iface["name"] == self.iface["name"] for _iface in self.ifaces):
                 self.ifaces.append(self.iface)
 
+            self._refresh_desired_state()
             res["spec"]["desiredState"]["interfaces"] = self.desired_state["interfaces"]
 
         return res
 
     def apply(self, resource=None):
         resource = resource if resource else super().to_dict()
-        samples = TimeoutSampler(
-            wait_timeout=3,
-            sleep=1,
-            exceptions=ConflictError,
-            func=self.update,
-            resource_dict=resource,
-        )
         LOGGER.info(f"Applying {resource}")
-        for _ in samples:
-            return
+        retries_on_conflict = 6
+        delay = 0.05
+        while True:
+            try:
+                return self.update(resource_dict=resource)
+            except ConflictError:
+                retries_on_conflict -= 1
+                if retries_on_conflict == 0:
+                    raise
+
+                time.sleep(delay)
+                delay = min(delay * 2, 1)
 
     def deploy(self):
         if self._ipv4_dhcp:
             self._ipv4_state_backup()
 
         if self.mtu:
-            for pod in self.worker_pods:
-                for port in self.ports:
-                    mtu = pod.execute(
-                        command=["cat", f"/sys/class/net/{port}/mtu"]
-                    ).strip()
-                    LOGGER.info(
-                        f"Backup MTU: {pod.node.name} interface {port} MTU is {mtu}"
-                    )
-                    self.mtu_dict[port] = mtu
+            self._mtu_backup()
 
         self.create()
 
@@ -185,9 +189,14 @@ class NodeNetworkConfigurationPolicy(Resource):
 
             if self._ipv4_dhcp:
                 self._ipv4_state_backup()
-                self.iface["ipv4"] = {"dhcp": True, "enabled": True}
 
-            self.set_interface(interface=self.iface)
+            # Like to_dict, only touch the interface once it was set
+            if self.iface:
+                if self._ipv4_dhcp:
+                    self.iface["ipv4"] = {"dhcp": True, "enabled": True}
+
+                self.set_interface(interface=self.iface)
+
             self.apply()
 
     def clean_up(self):
@@ -201,14 +210,17 @@ class NodeNetworkConfigurationPolicy(Resource):
                 }
                 self.set_interface(interface=_port)
 
-        for iface in self.ifaces:
-            """
-            If any physical interfaces are part of the policy - we will skip them,
-            because we don't want to delete them (and we actually can't, and this attempt
-            would end with failure).
-            """
-            if iface["name"] in self.node_active_nics:
-                continue
+            self._refresh_desired_state()
+
+        """
+        If any physical interfaces are part of the policy - we will skip them,
+        because we don't want to delete them (and we actually can't, and this attempt
+        would end with failure).
+        _absent_interface handles all the interfaces at once, so a single pass is
+        needed as long as any of them is not an active NIC.
+        """
+        node_active_nics = set(self.node_active_nics)
+        if any(iface["name"] not in node_active_nics for iface in self.ifaces):
             try:
                 self._absent_interface()
                 self.wait_for_status_success()
@@ -217,108 +229,179 @@ class NodeNetworkConfigurationPolicy(Resource):
                 LOGGER.error(e)
 
         self.delete()
+        self._nns_cache.clear()
 
     def wait_for_interface_deleted(self):
-        for pod in self.worker_pods:
+        def _wait_for_node_interfaces_deleted(node_network_state):
+            interfaces = {
+                iface["name"]: iface for iface in node_network_state.interfaces
+            }
+            names = []
             for iface in self.ifaces:
                 iface_name = iface["name"]
-                node_network_state = NodeNetworkState(name=pod.node.name)
-                iface_dict = node_network_state.get_interface(name=iface_name)
-                if iface_dict.get("type") == "ethernet":
+                if interfaces.get(iface_name, {}).get("type") == "ethernet":
                     LOGGER.info(f"{iface_name} is type ethernet, skipping.")
                     continue
 
-                node_network_state.wait_until_deleted(name=iface_name)
+                names.append(iface_name)
+
+            node_network_state.wait_until_interfaces_deleted(names=names)
+
+        self._run_on_nodes(func=_wait_for_node_interfaces_deleted)
 
     def validate_create(self):
-        for pod in self.worker_pods:
-            for bridge in self.ifaces:
-                node_network_state = NodeNetworkState(name=pod.node.name)
-                node_network_state.wait_until_up(name=bridge["name"])
+        def _wait_for_node_interfaces_up(node_network_state):
+            node_network_state.wait_until_interfaces_up(
+                names=[bridge["name"] for bridge in self.ifaces]
+            )
+
+        self._run_on_nodes(func=_wait_for_node_interfaces_up)
+
+    def _run_on_nodes(self, func):
+        # Run func concurrently with the NodeNetworkState of each worker node
+        node_network_states = [
+            self._nns(node_name=node_name)
+            for node_name in {pod.node.name for pod in self.worker_pods}
+        ]
+        if not node_network_states:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(node_network_states)) as executor:
+            futures = [
+                (node_network_state.name, executor.submit(func, node_network_state))
+                for node_network_state in node_network_states
+            ]
+
+        # Let every node finish so one failing node does not hide the others
+        errors = []
+        for node_name, future in futures:
+            error = future.exception()
+            if error:
+                LOGGER.error(f"{node_name}: {error}")
+                errors.append(error)
+
+        if errors:
+            raise errors[0]
+
+    def _nns(self, node_name):
+        # NodeNetworkState init fetches the instance, create it only once per node
+        if node_name not in self._nns_cache:
+            self._nns_cache[node_name] = NodeNetworkState(
+                name=node_name, client=self.client
+            )
+
+        return self._nns_cache[node_name]
+
+    def _mtu_backup(self):
+        def _get_port_mtu(pod, port):
+            mtu = pod.execute(command=["cat", f"/sys/class/net/{port}/mtu"]).strip()
+            LOGGER.info(f"Backup MTU: {pod.node.name} interface {port} MTU is {mtu}")
+            return mtu
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [
+                (port, executor.submit(_get_port_mtu, pod=pod, port=port))
+                for pod in self.worker_pods
+                for port in self.ports
+            ]
+            # Collected in submission order, the last pod wins as in a sequential run
+            for port, future in futures:
+                self.mtu_dict[port] = future.result()
 
     def _ipv4_state_backup(self):
         # Backup current state of dhcp for the interfaces which arent veth or current bridge
+        self.ipv4_iface_state.update(self._ipv4_state_by_node())
+
+    def _ipv4_state_by_node(self):
+        # Current ipv4 state of the ports on every worker node, from a single list call
+        interfaces_by_node = NodeNetworkState.interfaces_by_node(dyn_client=self.client)
+        ports = set(self.ports)
+        ipv4_state_by_node = {}
         for pod in self.worker_pods:
-            node_network_state = NodeNetworkState(name=pod.node.name)
-            self.ipv4_iface_state[pod.node.name] = {}
-            for interface in node_network_state.instance.status.currentState.interfaces:
-                if interface["name"] in self.ports:
-                    self.ipv4_iface_state[pod.node.name].update(
-                        {
-                            interface["name"]: {
-                                k: interface["ipv4"][k] for k in ("dhcp", "enabled")
-                            }
-                        }
-                    )
+            node_name = pod.node.name
+            interfaces = interfaces_by_node[node_name]
+            ipv4_state_by_node[node_name] = {
+                interface["name"]: {
+                    "dhcp": interface["ipv4"]["dhcp"],
+                    "enabled": interface["ipv4"]["enabled"],
+                }
+                for interface in interfaces
+                if interface["name"] in ports
+            }
+
+        return ipv4_state_by_node
 
     def _absent_interface(self):
         for bridge in self.ifaces:
             bridge["state"] = self.Interface.State.ABSENT
             self.set_interface(interface=bridge)
 
-            if self._ipv4_dhcp:
-                temp_ipv4_iface_state = {}
-                for pod in self.worker_pods:
-                    node_network_state = NodeNetworkState(name=pod.node.name)
-                    temp_ipv4_iface_state[pod.node.name] = {}
-                    # Find which interfaces got changed (of those that are connected to bridge)
-                    for (
-                        interface
-                    ) in node_network_state.instance.status.currentState.interfaces:
-                        if interface["name"] in self.ports:
-                            x = {k: interface["ipv4"][k] for k in ("dhcp", "enabled")}
-                            if (
-                                self.ipv4_iface_state[pod.node.name][interface["name"]]
-                                != x
-                            ):
-                                temp_ipv4_iface_state[pod.node.name].update(
-                                    {
-                                        interface["name"]: self.ipv4_iface_state[
-                                            pod.node.name
-                                        ][interface["name"]]
-                                    }
-                                )
+        if self._ipv4_dhcp:
+            temp_ipv4_iface_state = {}
+            for node_name, current_state in self._ipv4_state_by_node().items():
+                ipv4_state = self.ipv4_iface_state[node_name]
+                # Find which interfaces got changed (of those that are connected to bridge)
+                temp_ipv4_iface_state[node_name] = {
+                    iface_name: ipv4_state[iface_name]
+                    for iface_name, ipv4 in current_state.items()
+                    if ipv4_state[iface_name] != ipv4
+                }
 
-                previous_state = next(iter(temp_ipv4_iface_state.values()))
+            previous_state = next(iter(temp_ipv4_iface_state.values()))
 
-                # Restore DHCP state of the changed bridge connected ports
-                for iface_name, ipv4 in previous_state.items():
-                    interface = {"name": iface_name, "ipv4": ipv4}
-                    self.set_interface(interface=interface)
+            # Restore DHCP state of the changed bridge connected ports
+            for iface_name, ipv4 in previous_state.items():
+                interface = {"name": iface_name, "ipv4": ipv4}
+                self.set_interface(interface=interface)
 
+        self._refresh_desired_state()
         self.apply(resource=self._resource_dict_for_cleanup())
 
     def status(self):
-        for condition in self.instance.status.conditions:
-            if condition["type"] == self.Conditions.Type.AVAILABLE:
-                return condition["reason"]
+        return next(
+            (
+                condition["reason"]
+                for condition in self.instance.status.conditions
+                if condition["type"] == self.Conditions.Type.AVAILABLE
+            ),
+            None,
+        )
+
+    def wait_for_conditions(self):
+        for nncp in self.watch_instance(timeout=30):
+            if (nncp.get("status") or {}).get("conditions"):
+                return
 
     def wait_for_status_success(self):
         # if we get here too fast there are no conditions, we need to wait.
         self.wait_for_conditions()
 
-        samples = TimeoutSampler(wait_timeout=480, sleep=1, func=self.status)
         try:
-            for sample in samples:
-                if sample == self.Conditions.Reason.SUCCESS:
-                    LOGGER.info("NNCP configured Successfully")
-                    return sample
-
-                if sample == self.Conditions.Reason.FAILED:
-                    for failed_nnce in self._get_failed_nnce():
-                        nnce_dict = failed_nnce.instance.to_dict()
-                        for cond in nnce_dict["status"]["conditions"]:
-                            error = re.findall(
-                                r"libnmstate.error.*", cond.get("message", "")
-                            )
-                            if error:
-                                LOGGER.error(
-                                    f"NNCE {nnce_dict['metadata']['name']}: {error[0]}"
+            for nncp in self.watch_instance(timeout=480):
+                conditions = (nncp.get("status") or {}).get("conditions") or []
+                for condition in conditions:
+                    if condition["type"] != self.Conditions.Type.AVAILABLE:
+                        continue
+
+                    if condition["reason"] == self.Conditions.Reason.SUCCESS:
+                        LOGGER.info("NNCP configured Successfully")
+                        return condition["reason"]
+
+                    if condition["reason"] == self.Conditions.Reason.FAILED:
+                        for failed_nnce in self._get_failed_nnce():
+                            nnce_dict = failed_nnce.instance.to_dict()
+                            for cond in nnce_dict["status"]["conditions"]:
+                                error = re.findall(
+                                    r"libnmstate.error.*", cond.get("message", "")
                                 )
+                                if error:
+                                    LOGGER.error(
+                                        f"NNCE {nnce_dict['metadata']['name']}: {error[0]}"
+                                    )
 
-                    raise NNCPConfigurationFailed(
-                        f"Reason: {self.Conditions.Reason.FAILED}"
-                    )
+                        raise NNCPConfigurationFailed(
+                            f"Reason: {self.Conditions.Reason.FAILED}"
+                        )
 
         except (TimeoutExpiredError, NNCPConfigurationFailed):
             LOGGER.error("Unable to configure NNCP for node")
@@ -340,7 +423,8 @@ class NodeNetworkConfigurationPolicy(Resource):
                     yield nnce
 
     def _resource_dict_for_cleanup(self):
-        resource_dict = self.to_dict()
+        # The whole spec is replaced below, only the base body is needed
+        resource_dict = super().to_dict()
         desired_state = {"interfaces": self.ifaces}
         resource_dict.update({"spec": {"desiredState": desired_state}})
         if self.routes:
@@ -89,6 +89,57 @@ class NodeNetworkState(Resource):
             if not sample:
                 return
 
+    def wait_until_interfaces_up(self, names):
+        LOGGER.info(f"Checking if interfaces {names} are up -- {self.name}")
+        self._wait_for_interfaces(
+            names=names,
+            func=lambda iface: iface.get("state") == self.Interface.State.UP,
+        )
+
+    def wait_until_interfaces_deleted(self, names):
+        LOGGER.info(f"Checking if interfaces {names} are deleted -- {self.name}")
+        self._wait_for_interfaces(names=names, func=lambda iface: not iface)
+
+    def _wait_for_interfaces(self, names, func):
+        # A single watch serves all the interfaces, stop once func is true for all of them
+        pending = set(names)
+        if not pending:
+            return
+
+        for nns in self.watch_instance(timeout=TIMEOUT):
+            current_state = (nns.get("status") or {}).get("currentState") or {}
+            interfaces = {
+                iface["name"]: iface for iface in current_state.get("interfaces") or []
+            }
+            pending = {name for name in pending if not func(interfaces.get(name, {}))}
+            if not pending:
+                return
+
+    @classmethod
+    def interfaces_by_node(cls, dyn_client):
+        """
+        Get the current interfaces of all nodes with a single list call
+
+        Args:
+            dyn_client (DynamicClient): Open connection to remote cluster
+
+        Returns:
+            dict: Node name to list of current interfaces
+        """
+
+        def _interfaces_by_node():
+            node_network_states = cls._prepare_resources(
+                dyn_client=dyn_client, singular_name=None
+            )
+            return {
+                nns.metadata.name: nns.status.currentState.interfaces
+                for nns in node_network_states.items
+                # Skip nodes whose handler did not report a state yet
+                if nns.status and nns.status.currentState
+            }
+
+        return cls._retry_etcd_changed(func=_interfaces_by_node)
+
     @property
     def interfaces(self):
         return self.instance.status.currentState.interfaces
@@ -2,15 +2,17 @@ import json
 import logging
 import os
 import re
+import time
 from distutils.version import Version
 
 import kubernetes
 import urllib3
+from kubernetes.client.rest import ApiException
 from openshift.dynamic import DynamicClient
 from openshift.dynamic.exceptions import InternalServerError, NotFoundError
 from urllib3.exceptions import ProtocolError
 
-from ocp_resources.utils import TimeoutExpiredError, TimeoutSampler
+from ocp_resources.utils import TimeoutExpiredError, TimeoutSampler, TimeoutWatch
 
 
 LOGGER = logging.getLogger(__name__)
@@ -731,6 +733,50 @@ class Resource(object):
             if sample:
                 return
 
+    def watch_instance(self, timeout=TIMEOUT):
+        """
+        Watch the resource and yield it on every change.
+
+        The first yielded value is the current state of the resource.
+        If the watch stream is closed or dropped before timeout, it is
+        reopened from the last seen resourceVersion.
+
+        Args:
+            timeout (int): Time to watch the resource.
+
+        Yields:
+            dict: Raw resource dict.
+
+        Raises:
+            TimeoutExpiredError: If timeout expired.
+        """
+        timeout_watch = TimeoutWatch(timeout=timeout)
+        resource_version = None
+        while timeout_watch.remaining_time() > 0:
+            try:
+                for event in self.api().watch(
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name={self.name}",
+                    resource_version=resource_version,
+                    timeout=max(int(timeout_watch.remaining_time()), 1),
+                ):
+                    raw_object = event["raw_object"]
+                    resource_version = raw_object["metadata"]["resourceVersion"]
+                    yield raw_object
+
+            except ProtocolError as exp:
+                LOGGER.warning(f"{self.kind} {self.name} watch dropped: {exp}")
+                time.sleep(1)
+
+            except ApiException as exp:
+                if exp.status != 410:
+                    raise
+
+                # resourceVersion is too old, restart from the current state
+                resource_version = None
+
+        raise TimeoutExpiredError(f"{self.kind} {self.name} watch for {timeout}")
+
 
 class NamespacedResource(Resource):
     """